@@ -2985,8 +2985,6 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
             generatedCodes.reserveCapacity(effectiveMaxTokens)
         }
         var pendingStreamCodes = [MLXArray]()
-        var generatedCodebookTokenIDs = Set<Int>()
-        generatedCodebookTokenIDs.reserveCapacity(effectiveMaxTokens)
         var generatedCodeCount = 0
         let eosTokenId = talkerConfig.codecEosTokenId
 
@@ -3188,6 +3186,10 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
         // as before — this only caches the arange/zeros/-inf rows that were
         // re-allocated 14× per frame). Sized lazily from the first CP logits.
         var codePredictorScratch: Qwen3SamplerScratch?
+        // Module lookups are loop-invariant; resolve them once instead of
+        // walking the talker/code-predictor property chain per codebook step.
+        let codecInputEmbedding = talker.getInputEmbeddings()
+        let codePredictorCodecEmbeddings = talker.codePredictor.codecEmbedding
 
         for _ in 0 ..< effectiveMaxTokens {
             try Task.checkCancellation()
@@ -3244,10 +3246,10 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
                     Qwen3Signposts.signposter.beginInterval("Code Predictor Step")
                 let codeInput: MLXArray
                 if codeIdx == 0 {
-                    let code0Embed = talker.getInputEmbeddings()(nextToken)
+                    let code0Embed = codecInputEmbedding(nextToken)
                     codeInput = concatenated([codeHidden, code0Embed], axis: 1)
                 } else {
-                    codeInput = talker.codePredictor.codecEmbedding[codeIdx - 1](codeTokens.last!)
+                    codeInput = codePredictorCodecEmbeddings[codeIdx - 1](codeTokens.last!)
                 }
 
                 let (codeLogits, _, _) = talker.codePredictor(
@@ -3302,9 +3304,9 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
             let codecEmbeddingStartedAt = ContinuousClock.now
             let codecEmbeddingSignpost =
                 Qwen3Signposts.signposter.beginInterval("Codec Embedding Assembly")
-            var codecEmbed = talker.getInputEmbeddings()(nextToken)
+            var codecEmbed = codecInputEmbedding(nextToken)
             for (i, code) in codeTokens.dropFirst().enumerated() {
-                codecEmbed = codecEmbed + talker.codePredictor.codecEmbedding[i](code)
+                codecEmbed = codecEmbed + codePredictorCodecEmbeddings[i](code)
             }
 
             inputEmbeds = textEmbed + codecEmbed
@@ -3362,7 +3364,6 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
                 generationEndReason = "eos"
                 break
             }
-            generatedCodebookTokenIDs.insert(tokenId)
             samplerScratch.appendRepetitionTokenID(tokenId)
             generatedCodeCount += 1
             if isStreaming {
@@ -3804,7 +3805,6 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
         }
 
         // Reference text and target text tokenization
-        let targetTokenCount = tokenizer.encode(text: text).count
         let refChatText = "<|im_start|>assistant\n\(refText)<|im_end|>\n"
         let refIds = MLXArray(tokenizer.encode(text: refChatText).map { Int32($0) }).reshaped(1, -1)
         let refCount = refIds.dim(1)
@@ -3824,6 +3824,9 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
         let targetStart = min(3, targetCount)
         let targetEnd = max(targetStart, targetCount - 5)
         let targetTextIds = targetIds[0..., targetStart ..< targetEnd]
+        // The token budget follows the target tokens actually conditioned on;
+        // a second BPE pass over the raw text only to count them is redundant.
+        let targetTokenCount = targetEnd - targetStart
 
         // TTS special tokens
         let ttsTokens = MLXArray(
@@ -4223,6 +4226,9 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
         private var suppressWithEOSNegInf: MLXArray?
 
         var repetitionTokenIDsBuffer: [Int32] = []
+        // O(1) membership for the per-step dedup; the buffer keeps insertion
+        // order for the MLX upload.
+        private var repetitionTokenIDSet = Set<Int32>()
         private var repetitionTokenIDsMLX: MLXArray?
 
         init(vocabSize: Int) {
@@ -4269,7 +4275,7 @@ public final class Qwen3TTSModel: Module, SpeechGenerationModel, Qwen3OptimizedS
 
         func appendRepetitionTokenID(_ tokenID: Int) {
             let value = Int32(tokenID)
-            guard !repetitionTokenIDsBuffer.contains(value) else { return }
+            guard repetitionTokenIDSet.insert(value).inserted else { return }
             repetitionTokenIDsBuffer.append(value)
             repetitionTokenIDsMLX = nil
         }
@@ -315,10 +315,10 @@ final class DecoderRMSNorm: Module, UnaryLayer {
         self.eps = eps
     }
 
+    /// Fused Metal kernel; it accumulates the mean square in float32 like the
+    /// explicit upcast it replaces, without materialising the float32 copy.
     func callAsFunction(_ x: MLXArray) -> MLXArray {
-        let xf = x.asType(.float32)
-        let v = mean(xf * xf, axis: -1, keepDims: true)
-        return (weight * (xf * rsqrt(v + eps))).asType(x.dtype)
+        MLXFast.rmsNorm(x, weight: weight, eps: eps).asType(x.dtype)
     }
 }
 
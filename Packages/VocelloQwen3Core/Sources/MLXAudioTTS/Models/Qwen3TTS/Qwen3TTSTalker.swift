@@ -360,6 +360,10 @@ final class Qwen3TTSTalkerForConditionalGeneration: Module {
     func getInputEmbeddings() -> Embedding { model.codecEmbedding }
     func getTextEmbeddings() -> Embedding { model.textEmbedding }
 
+    /// Returns logits for the last position only (`[batch, 1, vocab]`) plus the
+    /// full hidden states. Every caller samples from the final position, so
+    /// projecting the whole prefill through `codecHead` was an `L × D × V`
+    /// matmul whose rows were discarded.
     func callAsFunction(
         _ inputsEmbeds: MLXArray,
         positionIds: MLXArray? = nil,
@@ -367,7 +371,7 @@ final class Qwen3TTSTalkerForConditionalGeneration: Module {
         cache: [any KVCache]? = nil
     ) -> (MLXArray, MLXArray) {
         let hiddenStates = model(inputsEmbeds, positionIds: positionIds, mask: mask, cache: cache)
-        let logits = codecHead(hiddenStates)
+        let logits = codecHead(hiddenStates[0..., (-1)..., 0...])
         return (logits, hiddenStates)
     }
 
@@ -197,6 +197,8 @@ public struct NativeAudioPreparationService: AudioPreparationService, Hashable,
     public static let canonicalSampleRate: Double = 24_000
     public static let canonicalChannelCount: AVAudioChannelCount = 1
     public static let canonicalBitDepth = 16
+    public static let supportedInputSampleRates: ClosedRange<Double> = 8_000...384_000
+    public static let maxInputChannelCount: AVAudioChannelCount = 8
 
     public let preparedAudioDirectory: URL?
     public let limits: AudioPreparationLimits
@@ -303,9 +305,16 @@ public struct NativeAudioPreparationService: AudioPreparationService, Hashable,
                 "The selected audio file does not contain readable audio frames."
             )
         }
-        let inputDurationSeconds = inputFile.fileFormat.sampleRate > 0
-            ? Double(inputFile.length) / inputFile.fileFormat.sampleRate
-            : 0
+        // Bound the declared format before anything sizes buffers from it: a
+        // tiny file can claim an absurd rate or channel count in its header.
+        let inputFormat = inputFile.fileFormat
+        guard Self.supportedInputSampleRates.contains(inputFormat.sampleRate),
+              (1...Self.maxInputChannelCount).contains(inputFormat.channelCount) else {
+            throw AudioPreparationError.unsupportedInput(
+                "The selected audio file has an unsupported format (\(String(format: "%.0f", inputFormat.sampleRate)) Hz, \(inputFormat.channelCount) channels)."
+            )
+        }
+        let inputDurationSeconds = Double(inputFile.length) / inputFormat.sampleRate
         if limits.maxDecodedDurationSeconds > 0,
            inputDurationSeconds > limits.maxDecodedDurationSeconds {
             throw AudioPreparationError.inputDurationTooLong(
@@ -1403,18 +1403,30 @@ public final class MLXTTSEngine: TTSEngineRuntimeControlling, NativeMemoryReport
                 return [PreparedVoice]()
             }
 
-            var voices: [PreparedVoice] = []
+            // Partition the single enumeration pass into audio files and
+            // transcript stems so `hasTranscript` is a set lookup rather than
+            // one `fileExists` stat per saved voice.
+            var audioURLs: [URL] = []
+            var transcriptStemPaths = Set<String>()
             for fileURL in (enumerator.allObjects as? [URL]) ?? [] {
-                guard Self.supportedSavedVoiceAudioExtensions.contains(fileURL.pathExtension.lowercased()) else {
-                    continue
+                let pathExtension = fileURL.pathExtension.lowercased()
+                if pathExtension == "txt" {
+                    transcriptStemPaths.insert(fileURL.deletingPathExtension().path)
+                } else if Self.supportedSavedVoiceAudioExtensions.contains(pathExtension) {
+                    audioURLs.append(fileURL)
                 }
-                let transcriptURL = fileURL.deletingPathExtension().appendingPathExtension("txt")
+            }
+
+            var voices: [PreparedVoice] = []
+            voices.reserveCapacity(audioURLs.count)
+            for fileURL in audioURLs {
+                let stemURL = fileURL.deletingPathExtension()
                 voices.append(
                     PreparedVoice(
-                        id: fileURL.deletingPathExtension().lastPathComponent,
-                        name: fileURL.deletingPathExtension().lastPathComponent,
+                        id: stemURL.lastPathComponent,
+                        name: stemURL.lastPathComponent,
                         audioPath: fileURL.path,
-                        hasTranscript: fileManager.fileExists(atPath: transcriptURL.path),
+                        hasTranscript: transcriptStemPaths.contains(stemURL.path),
                         qualityWarnings: Self.savedReferenceQualityWarnings(forAudioAt: fileURL.path)
                     )
                 )
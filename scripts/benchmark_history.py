@@ -404,11 +404,8 @@ def sha256_bytes(value: bytes) -> str:
 
 
 def file_digest(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def record_digest(record: dict[str, Any]) -> str:
@@ -741,9 +738,19 @@ def git_state() -> dict[str, Any]:
     if diff.returncode != 0:
         raise HistoryError(f"git diff failed: {diff.stderr.decode('utf-8', 'replace').strip()}")
     digest.update(diff.stdout)
+    # One ls-files call answers "is this tracked?" for every changed path;
+    # probing each path separately spawned a git process per dirty file.
+    tracked: set[str] = set()
+    if paths:
+        listed = subprocess.run(
+            ["git", "ls-files", "-z", "--", *paths],
+            cwd=REPO_ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False,
+        )
+        if listed.returncode == 0:
+            tracked = set(listed.stdout.decode("utf-8", "surrogateescape").split("\0"))
     for relative in paths:
         candidate = REPO_ROOT / relative
-        if candidate.is_file() and run_command(["git", "ls-files", "--error-unmatch", "--", relative], check=False) == "":
+        if candidate.is_file() and relative not in tracked:
             digest.update(relative.encode("utf-8"))
             digest.update(b"\0")
             digest.update(file_digest(candidate).encode("ascii"))
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import hashlib
 import json
 import os
@@ -144,24 +145,21 @@ def allocated_bytes(path: Path) -> int:
     except FileNotFoundError:
         return 0
     total = 0
-    for parent, directories, files in os.walk(path, followlinks=False):
-        parent_path = Path(parent)
-        kept: list[str] = []
-        for name in directories:
-            child = parent_path / name
-            try:
-                if child.is_symlink():
-                    total += child.lstat().st_blocks * 512
-                else:
-                    kept.append(name)
-            except FileNotFoundError:
-                continue
-        directories[:] = kept
-        for name in files:
-            try:
-                total += (parent_path / name).lstat().st_blocks * 512
-            except FileNotFoundError:
-                continue
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_blocks * 512
+                except FileNotFoundError:
+                    continue
     return total
 
 
@@ -183,11 +181,8 @@ def canonical_digest(value: Any) -> str:
 
 
 def file_digest(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as stream:
-        for block in iter(lambda: stream.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+        return hashlib.file_digest(stream, "sha256").hexdigest()
 
 
 def trace_digest(trace: Path) -> str:
@@ -868,8 +863,13 @@ def assert_no_active_build(policy: dict[str, Any]) -> None:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def resolve_lsof_binary() -> str | None:
+    return shutil.which("lsof")
+
+
 def assert_paths_idle(paths: Iterable[Path]) -> None:
-    lsof = shutil.which("lsof")
+    lsof = resolve_lsof_binary()
     existing = [path for path in paths if path.exists() and not path.is_symlink()]
     if not existing:
         return
@@ -887,13 +887,14 @@ def assert_paths_idle(paths: Iterable[Path]) -> None:
 
 
 def remove_external_xcode(cleaner: Cleaner, policy: dict[str, Any]) -> None:
+    lsof = resolve_lsof_binary()
     for candidate in matching_external_derived_data(policy):
         probe = subprocess.run(
-            ["lsof", "+D", str(candidate)],
+            [lsof, "+D", str(candidate)],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             check=False,
-        ) if shutil.which("lsof") else None
+        ) if lsof else None
         if probe is not None and probe.returncode == 0:
             raise CleanupError(f"external Xcode DerivedData appears to be in use: {candidate}")
         size = allocated_bytes(candidate)
@@ -1302,11 +1302,8 @@ def _tracked_under(policy: LoadedPolicy, relative: str) -> list[str]:
 
 
 def _file_digest(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        while chunk := handle.read(1024 * 1024):
-            digest.update(chunk)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def _tree_signature(path: Path) -> tuple[Any, ...]:
@@ -24,9 +24,9 @@ def cast_dir(src: str, dst: str):
     for root, dirs, files in os.walk(src):
         rel = os.path.relpath(root, src)
         out_root = os.path.join(dst, rel)
+        # os.walk visits every directory as `root`, so this one call creates
+        # each output directory exactly once.
         os.makedirs(out_root, exist_ok=True)
-        for d in dirs:
-            os.makedirs(os.path.join(out_root, d), exist_ok=True)
         for f in files:
             src_path = os.path.join(root, f)
             dst_path = os.path.join(out_root, f)
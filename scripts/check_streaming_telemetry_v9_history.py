@@ -22,14 +22,8 @@ SIDECAR_SUFFIX = ".streaming-telemetry-v9.json"
 
 
 def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        while True:
-            chunk = handle.read(1024 * 1024)
-            if not chunk:
-                break
-            digest.update(chunk)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def evaluate_generations(path: Path) -> list[str]:
@@ -1072,11 +1072,8 @@ def status_payload(policy: LoadedPolicy, codex_home: Path) -> dict[str, Any]:
 
 
 def _hash_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def inspect_executor(codex_bin: str) -> dict[str, str]:
@@ -48,6 +48,15 @@ CURRENT_RUNTIME_STALE_GUIDANCE = {
         "MLXTTSEngine now provides the ActiveGenerationCancellable capability",
 }
 
+SLUG_HTML_TAG_RE = re.compile(r"<[^>]+>")
+SLUG_DISALLOWED_RE = re.compile(r"[^\w\- ]", re.UNICODE)
+SLUG_WHITESPACE_RE = re.compile(r"\s")
+HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+INLINE_CODE_RE = re.compile(r"`([^`\n]+)`")
+FENCED_CODE_RE = re.compile(r"```[^\n]*\n(.*?)```", re.DOTALL)
+LINE_SUFFIX_RE = re.compile(r":\d+(?:-\d+)?$")
+BUILD_PLACEHOLDER_RE = re.compile(r"[<{]")
+
 
 def load_json(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
@@ -109,9 +118,9 @@ def historical_markdown_paths(root: Path) -> list[Path]:
 
 
 def markdown_slug(value: str) -> str:
-    value = re.sub(r"<[^>]+>", "", value).strip().lower()
-    value = re.sub(r"[^\w\- ]", "", value, flags=re.UNICODE)
-    return re.sub(r"\s", "-", value)
+    value = SLUG_HTML_TAG_RE.sub("", value).strip().lower()
+    value = SLUG_DISALLOWED_RE.sub("", value)
+    return SLUG_WHITESPACE_RE.sub("-", value)
 
 
 def headings(path: Path) -> set[str]:
@@ -124,7 +133,7 @@ def headings(path: Path) -> set[str]:
             continue
         if fenced:
             continue
-        match = re.match(r"^#{1,6}\s+(.+?)\s*#*\s*$", line)
+        match = HEADING_RE.match(line)
         if not match:
             continue
         base = markdown_slug(match.group(1))
@@ -183,9 +192,9 @@ def validate_repository_paths(root: Path, paths: list[Path]) -> list[str]:
     errors: list[str] = []
     for source in paths:
         text = source.read_text(encoding="utf-8")
-        for value in re.findall(r"`([^`\n]+)`", text):
+        for value in INLINE_CODE_RE.findall(text):
             candidate = value.strip().split()[0].rstrip(".,;:")
-            candidate = re.sub(r":\d+(?:-\d+)?$", "", candidate)
+            candidate = LINE_SUFFIX_RE.sub("", candidate)
             if not candidate.startswith(prefixes) or any(marker in candidate for marker in ("<", ">", "{", "}", "$", "...")):
                 continue
             normalized = candidate.rstrip("/")
@@ -222,12 +231,12 @@ def validate_build_references(root: Path, paths: list[Path]) -> list[str]:
     errors: list[str] = []
     for source in paths:
         text = source.read_text(encoding="utf-8")
-        regions = [(match.group(1), match.start(1)) for match in re.finditer(r"`([^`\n]+)`", text)]
-        regions.extend((match.group(1), match.start(1)) for match in re.finditer(r"```[^\n]*\n(.*?)```", text, re.DOTALL))
+        regions = [(match.group(1), match.start(1)) for match in INLINE_CODE_RE.finditer(text)]
+        regions.extend((match.group(1), match.start(1)) for match in FENCED_CODE_RE.finditer(text))
         for region, offset in regions:
             for match in pattern.finditer(region):
                 candidate = match.group("path").rstrip("/.,;:")
-                static = re.split(r"[<{]", candidate, maxsplit=1)[0].rstrip("/")
+                static = BUILD_PLACEHOLDER_RE.split(candidate, maxsplit=1)[0].rstrip("/")
                 if static in allowed or any(candidate == owned or candidate.startswith(owned + "/") for owned in owned_roots):
                     continue
                 line = text.count("\n", 0, offset + match.start("path")) + 1
@@ -59,24 +59,21 @@ def allocated_bytes(path: Path) -> int:
     except FileNotFoundError:
         return 0
     total = 0
-    for parent, directories, files in os.walk(path, followlinks=False):
-        parent_path = Path(parent)
-        kept: list[str] = []
-        for name in directories:
-            child = parent_path / name
-            try:
-                if child.is_symlink():
-                    total += child.lstat().st_blocks * 512
-                else:
-                    kept.append(name)
-            except FileNotFoundError:
-                continue
-        directories[:] = kept
-        for name in files:
-            try:
-                total += (parent_path / name).lstat().st_blocks * 512
-            except FileNotFoundError:
-                continue
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_blocks * 512
+                except FileNotFoundError:
+                    continue
     return total
 
 
@@ -62,14 +62,11 @@ def load_json(path: Path) -> dict[str, Any]:
 
 
 def digest_file(path: Path) -> str:
-    digest = hashlib.sha256()
     try:
         with path.open("rb") as stream:
-            for block in iter(lambda: stream.read(1024 * 1024), b""):
-                digest.update(block)
+            return hashlib.file_digest(stream, "sha256").hexdigest()
     except OSError as error:
         raise RetentionError(f"could not hash {path}: {error}") from error
-    return digest.hexdigest()
 
 
 def canonical_bytes(value: Any) -> bytes:
@@ -178,18 +175,25 @@ def directory_bytes(path: Path) -> int:
     if path.is_symlink() or not path.is_dir():
         raise RetentionError(f"raw trace must be a real directory: {path}")
     total = 0
-    for parent, directories, files in os.walk(path, followlinks=False):
-        directories[:] = [
-            name for name in directories if not (Path(parent) / name).is_symlink()
-        ]
-        for name in files:
-            child = Path(parent) / name
-            if child.is_symlink():
-                continue
-            try:
-                total += child.stat().st_size
-            except FileNotFoundError:
-                continue
+    pending = [os.fspath(path)]
+    while pending:
+        # One scandir pass per directory: the entry type comes from the
+        # directory listing, so only regular payload files cost a stat call.
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    total += entry.stat(follow_symlinks=False).st_size
+                except FileNotFoundError:
+                    continue
     return total
 
 
@@ -259,14 +259,11 @@ def digest_bytes(value: bytes) -> str:
 
 
 def digest_file(path: Path) -> str:
-    digest = hashlib.sha256()
     try:
         with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                digest.update(chunk)
+            return hashlib.file_digest(handle, "sha256").hexdigest()
     except OSError as error:
         raise PublicationError(f"cannot hash {path}: {error}") from error
-    return digest.hexdigest()
 
 
 def utc_now() -> str:
@@ -1841,7 +1838,7 @@ def validate_prompt_equivalence(
         if (
             sentinel.get("promptDigestScope") != "resolved"
             or not isinstance(digest, str)
-            or re.fullmatch(r"[0-9a-f]{64}", digest) is None
+            or SAFE_DIGEST.fullmatch(digest) is None
         ):
             raise PublicationError(f"language cell {cell_id} lacks a resolved prompt digest")
         notes = rows_by_cell[cell_id].get("notes")
@@ -2114,7 +2111,7 @@ def language_output_evidence(
         raise PublicationError(f"language cell {cell_id} output.wav is unreadable: {error}") from error
     actual_duration = actual_frames / actual_sample_rate if actual_sample_rate > 0 else 0.0
     if (
-        not isinstance(digest, str) or re.fullmatch(r"[0-9a-f]{64}", digest) is None
+        not isinstance(digest, str) or SAFE_DIGEST.fullmatch(digest) is None
         or isinstance(byte_count, bool) or not isinstance(byte_count, int) or byte_count <= 0
         or duration is None or duration <= 0
         or sample_rate is None or sample_rate <= 0 or not sample_rate.is_integer()
@@ -2502,7 +2499,7 @@ def _legacy_telemetry_overhead_record(args: argparse.Namespace) -> Path:
             )
         normalized = {str(key): str(value) for key, value in pcm.items()}
         if any(
-            not re.fullmatch(r"[0-9a-f]{64}", value) or value == empty_pcm_digest
+            not SAFE_DIGEST.fullmatch(value) or value == empty_pcm_digest
             for value in normalized.values()
         ):
             raise PublicationError(
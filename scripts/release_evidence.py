@@ -31,11 +31,8 @@ DIGEST = re.compile(r"[0-9a-f]{64}")
 
 
 def digest_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def canonical_bytes(value: Any) -> bytes:
@@ -25,11 +25,8 @@ def canonical_bytes(value: Any) -> bytes:
 
 
 def sha256(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def _npm_name(path: str, payload: dict[str, Any]) -> str:
@@ -79,11 +79,8 @@ def payload_digest(payload: dict[str, Any], *, digest_field: str | None = None)
 
 
 def file_digest(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as stream:
-        for block in iter(lambda: stream.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+        return hashlib.file_digest(stream, "sha256").hexdigest()
 
 
 def source_identity_digest(path: Path) -> str: